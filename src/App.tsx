@@ -15,6 +15,7 @@ const queryClient = new QueryClient();
 
 const App = () => {
   useEffect(() => {
+    if (!import.meta.env.DEV) return;
     console.log('SpecSailor App mounted');
     console.log('BASE_URL:', import.meta.env.BASE_URL);
     console.log('MODE:', import.meta.env.MODE);
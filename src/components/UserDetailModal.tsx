@@ -5,12 +5,13 @@ import {
   DialogHeader,
   DialogTitle,
 } from "@/components/ui/dialog";
-import { UserPrediction } from "@/data/mockData";
+import { UserPrediction } from "@/services/dataLoader";
+import { RiskLevel } from "@/data/mockData";
 import { RiskBadge } from "./RiskBadge";
 import { Badge } from "@/components/ui/badge";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, Cell } from 'recharts';
-import { AlertCircle, CheckCircle, TrendingDown, Calendar, Activity } from "lucide-react";
+import { AlertCircle, CheckCircle, TrendingDown, Calendar, Activity, LucideIcon } from "lucide-react";
 
 interface UserDetailModalProps {
   user: UserPrediction | null;
@@ -18,11 +19,31 @@ interface UserDetailModalProps {
   onOpenChange: (open: boolean) => void;
 }
 
-export const UserDetailModal = ({ user, open, onOpenChange }: UserDetailModalProps) => {
-  if (!user) return null;
+interface Intervention {
+  title: string;
+  icon: LucideIcon;
+  color: string;
+  actions: string[];
+  template: (customerId: string | undefined, tenure: number) => string;
+}
+
+interface ShapEntry {
+  feature: string;
+  value: number;
+  description: string;
+}
+
+// SHAP-like contributions only depend on the prediction record, so build them once per customer
+const shapCache = new WeakMap<UserPrediction, ShapEntry[]>();
 
-  // Generate SHAP-like feature contributions for Telco
-  const shapData = [
+// Generate SHAP-like feature contributions for Telco
+const getShapData = (user: UserPrediction): ShapEntry[] => {
+  const cached = shapCache.get(user);
+  if (cached) {
+    return cached;
+  }
+
+  const shapData: ShapEntry[] = [
     { 
       feature: 'Contract Type', 
       value: (user.features.is_monthly_contract || user.contractType?.toLowerCase().includes('month')) ? 18 : -8,
@@ -55,54 +76,58 @@ export const UserDetailModal = ({ user, open, onOpenChange }: UserDetailModalPro
     }
   ].sort((a, b) => Math.abs(b.value) - Math.abs(a.value));
 
-  // Generate intervention recommendation for Telco
-  const getIntervention = () => {
-    const customerId = user.customerId || user.userId;
-    const tenure = user.features.tenure_months || user.tenureMonths || 0;
-    
-    if (user.riskLevel === 'HIGH') {
-      return {
-        title: 'Immediate Intervention Required',
-        icon: AlertCircle,
-        color: 'risk-high',
-        actions: [
-          'Contact customer within 24 hours with retention offer',
-          'Offer contract upgrade with 15% discount',
-          'Propose service bundle to increase value',
-          'Schedule follow-up call in 3 days'
-        ],
-        template: `Dear ${customerId}, we value your business! We'd like to offer you a special retention package: upgrade to an annual contract and save 15% plus receive premium service bundles. Call us at 1-800-RETAIN today!`
-      };
-    } else if (user.riskLevel === 'MEDIUM') {
-      return {
-        title: 'Re-engagement Campaign',
-        icon: TrendingDown,
-        color: 'risk-medium',
-        actions: [
-          'Send email with service bundle promotion',
-          'Offer payment method optimization (auto-pay discount)',
-          'Highlight new services or features',
-          'Monitor account activity for 7 days'
-        ],
-        template: `Hi ${customerId}, thank you for being a valued customer for ${tenure} months! We have exciting new service bundles that could save you money. Check your email for exclusive offers!`
-      };
-    } else {
-      return {
-        title: 'Maintain Satisfaction',
-        icon: CheckCircle,
-        color: 'risk-low',
-        actions: [
-          'Continue regular account reviews',
-          'Send loyalty rewards and appreciation',
-          'Suggest service upgrades or add-ons',
-          'Request feedback for service improvement'
-        ],
-        template: `Thank you ${customerId} for your loyalty! As a valued customer of ${tenure} months, we'd love to hear your feedback and explore ways to enhance your service experience.`
-      };
-    }
-  };
+  shapCache.set(user, shapData);
+  return shapData;
+};
+
+// Intervention playbooks per risk level; only the message template depends on the customer
+const INTERVENTIONS: Record<RiskLevel, Intervention> = {
+  HIGH: {
+    title: 'Immediate Intervention Required',
+    icon: AlertCircle,
+    color: 'risk-high',
+    actions: [
+      'Contact customer within 24 hours with retention offer',
+      'Offer contract upgrade with 15% discount',
+      'Propose service bundle to increase value',
+      'Schedule follow-up call in 3 days'
+    ],
+    template: (customerId) => `Dear ${customerId}, we value your business! We'd like to offer you a special retention package: upgrade to an annual contract and save 15% plus receive premium service bundles. Call us at 1-800-RETAIN today!`
+  },
+  MEDIUM: {
+    title: 'Re-engagement Campaign',
+    icon: TrendingDown,
+    color: 'risk-medium',
+    actions: [
+      'Send email with service bundle promotion',
+      'Offer payment method optimization (auto-pay discount)',
+      'Highlight new services or features',
+      'Monitor account activity for 7 days'
+    ],
+    template: (customerId, tenure) => `Hi ${customerId}, thank you for being a valued customer for ${tenure} months! We have exciting new service bundles that could save you money. Check your email for exclusive offers!`
+  },
+  LOW: {
+    title: 'Maintain Satisfaction',
+    icon: CheckCircle,
+    color: 'risk-low',
+    actions: [
+      'Continue regular account reviews',
+      'Send loyalty rewards and appreciation',
+      'Suggest service upgrades or add-ons',
+      'Request feedback for service improvement'
+    ],
+    template: (customerId, tenure) => `Thank you ${customerId} for your loyalty! As a valued customer of ${tenure} months, we'd love to hear your feedback and explore ways to enhance your service experience.`
+  }
+};
+
+export const UserDetailModal = ({ user, open, onOpenChange }: UserDetailModalProps) => {
+  if (!user) return null;
+
+  const shapData = getShapData(user);
 
-  const intervention = getIntervention();
+  const customerId = user.customerId || user.userId;
+  const tenure = user.features.tenure_months || user.tenureMonths || 0;
+  const intervention = INTERVENTIONS[user.riskLevel] ?? INTERVENTIONS.LOW;
   const Icon = intervention.icon;
 
   return (
@@ -236,7 +261,7 @@ export const UserDetailModal = ({ user, open, onOpenChange }: UserDetailModalPro
               <div>
                 <h4 className="text-sm font-semibold mb-2">Message Template:</h4>
                 <div className="p-3 rounded-lg bg-card border border-border">
-                  <p className="text-sm italic">{intervention.template}</p>
+                  <p className="text-sm italic">{intervention.template(customerId, tenure)}</p>
                 </div>
               </div>
 
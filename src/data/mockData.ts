@@ -3,27 +3,42 @@
 
 export type RiskLevel = 'HIGH' | 'MEDIUM' | 'LOW';
 
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Seeded PRNG (mulberry32) so the demo series are identical on every load
+export function createSeededRandom(seed: number) {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
 // Generate trend data for Telco churn patterns
 export function generateTrendData() {
   const data = [];
-  const baseDate = new Date('2024-10-11'); // 30 days before base date
+  const random = createSeededRandom(42);
+  const baseTime = Date.parse('2024-10-11'); // 30 days before base date
 
   for (let i = 0; i < 30; i++) {
-    const date = new Date(baseDate);
-    date.setDate(date.getDate() + i);
+    // Step in whole UTC days from the base timestamp instead of copying and mutating a Date
+    const date = new Date(baseTime + i * DAY_MS);
 
     // Simulate realistic Telco churn patterns
-    const dayOfWeek = date.getDay();
+    const dayOfWeek = date.getUTCDay();
     const baseHigh = 450;
     const baseMedium = 1200;
     const baseLow = 5700;
 
     // Add variation based on day of week (weekends might have different patterns)
     const dayVariation = dayOfWeek === 0 || dayOfWeek === 6 ? 30 : 0;
-    const trendVariation = (Math.sin(i / 5) * 40) + (Math.random() * 80 - 40);
+    const trendVariation = (Math.sin(i / 5) * 40) + (random() * 80 - 40);
 
     data.push({
-      date: date.toISOString().split('T')[0],
+      date: date.toISOString().slice(0, 10),
       highRisk: Math.max(200, Math.floor(baseHigh + trendVariation + dayVariation)),
       mediumRisk: Math.max(800, Math.floor(baseMedium + trendVariation * 1.5 + dayVariation)),
       lowRisk: Math.max(5000, Math.floor(baseLow + trendVariation * 2 + dayVariation))
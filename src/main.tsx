@@ -2,8 +2,11 @@ import { createRoot } from "react-dom/client";
 import App from "./App.tsx";
 import "./index.css";
 
-console.log('Main.tsx loaded');
-console.log('Environment:', import.meta.env);
+// Startup diagnostics are for local development only; production builds skip them
+if (import.meta.env.DEV) {
+  console.log('Main.tsx loaded');
+  console.log('Environment:', import.meta.env);
+}
 
 const rootElement = document.getElementById("root");
 if (!rootElement) {
@@ -12,7 +15,9 @@ if (!rootElement) {
 } else {
   try {
     createRoot(rootElement).render(<App />);
-    console.log('App rendered successfully');
+    if (import.meta.env.DEV) {
+      console.log('App rendered successfully');
+    }
   } catch (error) {
     console.error('Error rendering app:', error);
     document.body.innerHTML = `<div style="padding: 20px; font-family: sans-serif;"><h1>Error loading app</h1><pre>${error}</pre></div>`;
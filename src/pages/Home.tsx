@@ -4,7 +4,7 @@ import { RiskBadge } from "@/components/RiskBadge";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { generateTrendData } from "@/data/mockData";
-import { loadPredictions } from "@/services/dataLoader";
+import { loadPredictions, summarizePredictions } from "@/services/dataLoader";
 import { Users, AlertTriangle, TrendingUp, Activity, Download, RefreshCw, Lightbulb } from "lucide-react";
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, Legend } from 'recharts';
 import { useMemo, useState, useEffect } from "react";
@@ -72,42 +72,33 @@ const Home = () => {
     setModalOpen(true);
   };
 
-  const stats = useMemo(() => {
-    const total = users.length;
-    const high = users.filter(u => u.riskLevel === 'HIGH').length;
-    const medium = users.filter(u => u.riskLevel === 'MEDIUM').length;
-    const low = users.filter(u => u.riskLevel === 'LOW').length;
-
-    return {
-      total,
-      high,
-      highPct: Math.round((high / total) * 100),
-      medium,
-      mediumPct: Math.round((medium / total) * 100),
-      low,
-      lowPct: Math.round((low / total) * 100)
-    };
-  }, [users]);
+  const stats = useMemo(() => summarizePredictions(users), [users]);
 
   const [showAllUsers, setShowAllUsers] = useState(false);
   const [currentPage, setCurrentPage] = useState(1);
   const [riskFilter, setRiskFilter] = useState<'ALL' | 'HIGH' | 'MEDIUM' | 'LOW'>('ALL');
   const usersPerPage = 50;
 
+  // Sort once per dataset; filtering keeps the order, so the views below never re-sort.
+  // Copy first so the loader's cached array is not reordered in place.
+  const usersByProbability = useMemo(() =>
+    [...users].sort((a, b) => b.churnProbability - a.churnProbability),
+    [users]
+  );
+
   const topAtRiskUsers = useMemo(() =>
-    users
+    usersByProbability
       .filter(u => u.riskLevel === 'HIGH')
-      .sort((a, b) => b.churnProbability - a.churnProbability)
       .slice(0, 10),
-    [users]
+    [usersByProbability]
   );
 
-  const filteredUsers = useMemo(() => {
-    const filtered = riskFilter === 'ALL'
-      ? users
-      : users.filter(u => u.riskLevel === riskFilter);
-    return filtered.sort((a, b) => b.churnProbability - a.churnProbability);
-  }, [users, riskFilter]);
+  const filteredUsers = useMemo(() =>
+    riskFilter === 'ALL'
+      ? usersByProbability
+      : usersByProbability.filter(u => u.riskLevel === riskFilter),
+    [usersByProbability, riskFilter]
+  );
 
   const paginatedUsers = useMemo(() => {
     const startIndex = (currentPage - 1) * usersPerPage;
@@ -2,6 +2,36 @@ import { Layout } from "@/components/Layout";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Lightbulb, TrendingDown, Zap, BookOpen, Users, PieChart as PieChartIcon } from "lucide-react";
 import { PieChart, Pie, Cell, ResponsiveContainer, Legend, Tooltip, LineChart, Line, XAxis, YAxis, CartesianGrid, BarChart, Bar, ScatterChart, Scatter, ZAxis } from 'recharts';
+import { createSeededRandom } from "@/data/mockData";
+
+// Tenure vs churn probability scatter data.
+// Generated once at module load from a fixed seed so the points stay put across re-renders and reloads.
+// The per-risk series are bucketed in the same pass instead of filtering the points on every render.
+type ScatterPoint = { tenure: number; churnProbability: number; monthlyCharges: number; fill: string };
+
+const scatterRandom = createSeededRandom(7);
+const tenureChurnScatter: ScatterPoint[] = [];
+const tenureChurnScatterByRisk: Record<'high' | 'medium' | 'low', ScatterPoint[]> = { high: [], medium: [], low: [] };
+
+for (let i = 0; i < 100; i++) {
+  const tenure = Math.floor(scatterRandom() * 72) + 1;
+  // Higher churn probability for lower tenure, especially with month-to-month
+  let baseProb = Math.max(0.05, 0.8 - (tenure / 100));
+  if (tenure < 12) baseProb += 0.15;
+  if (tenure < 6) baseProb += 0.1;
+  const churnProb = Math.min(0.95, baseProb + (scatterRandom() - 0.5) * 0.2);
+  const monthlyCharges = Math.floor(scatterRandom() * 100) + 20;
+  const risk = churnProb > 0.7 ? 'high' : churnProb > 0.3 ? 'medium' : 'low';
+  const point = {
+    tenure,
+    churnProbability: churnProb * 100,
+    monthlyCharges,
+    // Color based on churn probability
+    fill: `hsl(var(--risk-${risk}))`
+  };
+  tenureChurnScatter.push(point);
+  tenureChurnScatterByRisk[risk].push(point);
+}
 
 const Insights = () => {
   // Static demo insights based on real Telco data patterns
@@ -74,26 +104,6 @@ const Insights = () => {
     { services: 9, churnRate: 2.8, customers: 152 }
   ];
 
-  // Tenure vs churn probability scatter data
-  const tenureChurnScatter = Array.from({ length: 100 }, (_, i) => {
-    const tenure = Math.floor(Math.random() * 72) + 1;
-    // Higher churn probability for lower tenure, especially with month-to-month
-    let baseProb = Math.max(0.05, 0.8 - (tenure / 100));
-    if (tenure < 12) baseProb += 0.15;
-    if (tenure < 6) baseProb += 0.1;
-    const churnProb = Math.min(0.95, baseProb + (Math.random() - 0.5) * 0.2);
-    const monthlyCharges = Math.floor(Math.random() * 100) + 20;
-    return {
-      tenure,
-      churnProbability: churnProb * 100,
-      monthlyCharges,
-      // Color based on churn probability
-      fill: churnProb > 0.7 ? 'hsl(var(--risk-high))' :
-            churnProb > 0.3 ? 'hsl(var(--risk-medium))' :
-            'hsl(var(--risk-low))'
-    };
-  });
-
   return (
     <Layout>
       <div className="space-y-6">
@@ -534,19 +544,19 @@ const Insights = () => {
                 />
                 <Scatter 
                   name="High Risk" 
-                  data={tenureChurnScatter.filter(d => d.churnProbability > 70)} 
+                  data={tenureChurnScatterByRisk.high} 
                   fill="hsl(var(--risk-high))"
                   opacity={0.7}
                 />
                 <Scatter 
                   name="Medium Risk" 
-                  data={tenureChurnScatter.filter(d => d.churnProbability > 30 && d.churnProbability <= 70)} 
+                  data={tenureChurnScatterByRisk.medium} 
                   fill="hsl(var(--risk-medium))"
                   opacity={0.7}
                 />
                 <Scatter 
                   name="Low Risk" 
-                  data={tenureChurnScatter.filter(d => d.churnProbability <= 30)} 
+                  data={tenureChurnScatterByRisk.low} 
                   fill="hsl(var(--risk-low))"
                   opacity={0.7}
                 />
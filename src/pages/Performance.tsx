@@ -9,9 +9,25 @@ import { exportModelReport } from "@/utils/exportUtils";
 import { toast } from "sonner";
 import { useEffect, useState } from "react";
 
+// Feature names mapping for Telco features
+const FEATURE_DISPLAY_NAMES: Record<string, string> = {
+  'tenure_months': 'Tenure (Months)',
+  'contract_type_Month-to-month': 'Month-to-month Contract',
+  'payment_method_Electronic check': 'Electronic Check Payment',
+  'monthly_charges': 'Monthly Charges',
+  'total_services': 'Total Services',
+  'is_monthly_contract': 'Monthly Contract',
+  'billing_risk_score': 'Billing Risk Score',
+  'early_lifecycle_risk': 'Early Lifecycle Risk',
+  'total_charges': 'Total Charges',
+  'service_penetration_rate': 'Service Penetration Rate',
+  'has_premium_internet': 'Premium Internet (Fiber)',
+  'payment_reliability_score': 'Payment Reliability'
+};
+
 const Performance = () => {
   const [modelMetrics, setModelMetrics] = useState<any>(null);
-  const [featureImportance, setFeatureImportance] = useState<any[]>([]);
+  const [featureChartData, setFeatureChartData] = useState<{ name: string; importance: number }[]>([]);
   const [confusionMatrix, setConfusionMatrix] = useState<any>(null);
   const [isLoading, setIsLoading] = useState(true);
 
@@ -24,7 +40,11 @@ const Performance = () => {
         ]);
         setModelMetrics(metrics.metrics);
         setConfusionMatrix(metrics.confusion_matrix);
-        setFeatureImportance(importance.features);
+        // Shape the chart rows once when the data arrives rather than on every render
+        setFeatureChartData(importance.features.map(f => ({
+          name: FEATURE_DISPLAY_NAMES[f.feature] || f.feature,
+          importance: Math.round(f.importance * 100)
+        })));
       } catch (error) {
         console.error('Failed to load model data:', error);
         toast.error('Failed to load model performance data');
@@ -59,27 +79,6 @@ const Performance = () => {
     { name: 'False Negative', value: confusionMatrix.false_negatives, color: 'hsl(var(--risk-high))' }
   ];
 
-  // Feature names mapping for Telco features
-  const featureNames: Record<string, string> = {
-    'tenure_months': 'Tenure (Months)',
-    'contract_type_Month-to-month': 'Month-to-month Contract',
-    'payment_method_Electronic check': 'Electronic Check Payment',
-    'monthly_charges': 'Monthly Charges',
-    'total_services': 'Total Services',
-    'is_monthly_contract': 'Monthly Contract',
-    'billing_risk_score': 'Billing Risk Score',
-    'early_lifecycle_risk': 'Early Lifecycle Risk',
-    'total_charges': 'Total Charges',
-    'service_penetration_rate': 'Service Penetration Rate',
-    'has_premium_internet': 'Premium Internet (Fiber)',
-    'payment_reliability_score': 'Payment Reliability'
-  };
-
-  const featureChartData = featureImportance.map(f => ({
-    name: featureNames[f.feature] || f.feature,
-    importance: Math.round(f.importance * 100)
-  }));
-
   return (
     <Layout>
       <div className="space-y-6">
@@ -13,6 +13,16 @@ import { UserDetailModal } from "@/components/UserDetailModal";
 import { exportToCSV } from "@/utils/exportUtils";
 import { toast } from "sonner";
 
+type ContractBucket = 'monthly' | 'yearly' | 'biennial' | 'other';
+
+// Map raw contract labels ("monthly", "Month-to-month", "Two year", ...) onto the filter options
+const getContractBucket = (contractType: string): ContractBucket => {
+  if (contractType === 'biennial' || contractType.includes('two')) return 'biennial';
+  if (contractType === 'monthly' || contractType.includes('month')) return 'monthly';
+  if (contractType === 'yearly' || contractType.includes('year')) return 'yearly';
+  return 'other';
+};
+
 const Predictions = () => {
   const [allUsers, setAllUsers] = useState<any[]>([]);
   const [isLoading, setIsLoading] = useState(true);
@@ -41,20 +51,24 @@ const Predictions = () => {
   const [selectedUser, setSelectedUser] = useState<typeof allUsers[0] | null>(null);
   const [modalOpen, setModalOpen] = useState(false);
 
+  // Normalise the searchable fields and contract bucket once per dataset instead of on every keystroke
+  const searchableUsers = useMemo(() =>
+    allUsers.map(user => ({
+      user,
+      customerId: (user.customerId || user.userId || '').toLowerCase(),
+      contractBucket: getContractBucket((user.contractType || user.subscriptionType || '').toLowerCase()),
+    })),
+    [allUsers]
+  );
+
   const filteredUsers = useMemo(() => {
-    let filtered = allUsers.filter(user => {
-      const customerId = (user.customerId || user.userId || '').toLowerCase();
-      const matchesSearch = customerId.includes(searchQuery.toLowerCase());
-      const matchesRisk = riskFilter === "all" || user.riskLevel === riskFilter;
-      const contractType = (user.contractType || user.subscriptionType || '').toLowerCase();
-      const matchesContract = subscriptionFilter === "all" || 
-        (subscriptionFilter === "monthly" && contractType.includes("month")) ||
-        (subscriptionFilter === "yearly" && contractType.includes("year")) ||
-        (subscriptionFilter === "biennial" && contractType.includes("two")) ||
-        contractType === subscriptionFilter;
-      
-      return matchesSearch && matchesRisk && matchesContract;
-    });
+    const query = searchQuery.toLowerCase();
+    // Cheap equality checks first so the substring search only runs on rows that survive them
+    let filtered = searchableUsers.filter(({ user, customerId, contractBucket }) =>
+      (riskFilter === "all" || user.riskLevel === riskFilter) &&
+      (subscriptionFilter === "all" || contractBucket === subscriptionFilter) &&
+      (query === "" || customerId.includes(query))
+    ).map(({ user }) => user);
 
     // Apply sorting
     filtered.sort((a, b) => {
@@ -78,7 +92,7 @@ const Predictions = () => {
     });
 
     return filtered;
-  }, [allUsers, searchQuery, riskFilter, subscriptionFilter, sortField, sortDirection]);
+  }, [searchableUsers, searchQuery, riskFilter, subscriptionFilter, sortField, sortDirection]);
 
   const handleSort = (field: typeof sortField) => {
     if (sortField === field) {
@@ -64,10 +64,12 @@ export interface FeatureImportanceResponse {
   total_features: number;
 }
 
-// Cache for loaded data
-let predictionsCache: UserPrediction[] | null = null;
-let metricsCache: ModelPerformance | null = null;
-let featureImportanceCache: FeatureImportanceResponse | null = null;
+// Cache for loaded data. The in-flight promise is cached, so callers that
+// mount at the same time share one fetch instead of each starting their own.
+let predictionsCache: Promise<UserPrediction[]> | null = null;
+let metricsCache: Promise<ModelPerformance> | null = null;
+let featureImportanceCache: Promise<FeatureImportanceResponse> | null = null;
+let predictionIndexCache: Promise<Map<string, UserPrediction>> | null = null;
 
 /**
  * Get the base URL for fetching data files
@@ -77,80 +79,94 @@ const getBaseUrl = () => {
 };
 
 /**
- * Load all predictions from static JSON file
+ * Fetch and parse a JSON file from the public data folder
  */
-export const loadPredictions = async (): Promise<UserPrediction[]> => {
-  if (predictionsCache) {
-    return predictionsCache;
-  }
-
+const fetchDataFile = async <T>(fileName: string, label: string): Promise<T> => {
   try {
     const baseUrl = getBaseUrl();
-    const response = await fetch(`${baseUrl}data/predictions.json`);
+    const response = await fetch(`${baseUrl}data/${fileName}`);
     if (!response.ok) {
-      throw new Error(`Failed to load predictions: ${response.statusText}`);
+      throw new Error(`Failed to load ${label}: ${response.statusText}`);
     }
-    const data = await response.json();
-    predictionsCache = data;
-    return data;
+    return await response.json();
   } catch (error) {
-    console.error('Error loading predictions:', error);
+    console.error(`Error loading ${label}:`, error);
     throw error;
   }
 };
 
 /**
- * Load model performance metrics
+ * Load all predictions from static JSON file
  */
-export const loadModelMetrics = async (): Promise<ModelPerformance> => {
-  if (metricsCache) {
-    return metricsCache;
+export const loadPredictions = (): Promise<UserPrediction[]> => {
+  if (!predictionsCache) {
+    predictionsCache = fetchDataFile<UserPrediction[]>('predictions.json', 'predictions').catch((error) => {
+      // Drop the failed promise so the next call retries
+      predictionsCache = null;
+      throw error;
+    });
   }
+  return predictionsCache;
+};
 
-  try {
-    const baseUrl = getBaseUrl();
-    const response = await fetch(`${baseUrl}data/model_metrics.json`);
-    if (!response.ok) {
-      throw new Error(`Failed to load metrics: ${response.statusText}`);
-    }
-    const data = await response.json();
-    metricsCache = data;
-    return data;
-  } catch (error) {
-    console.error('Error loading metrics:', error);
-    throw error;
+/**
+ * Load model performance metrics
+ */
+export const loadModelMetrics = (): Promise<ModelPerformance> => {
+  if (!metricsCache) {
+    metricsCache = fetchDataFile<ModelPerformance>('model_metrics.json', 'metrics').catch((error) => {
+      metricsCache = null;
+      throw error;
+    });
   }
+  return metricsCache;
 };
 
 /**
  * Load feature importance data
  */
-export const loadFeatureImportance = async (): Promise<FeatureImportanceResponse> => {
-  if (featureImportanceCache) {
-    return featureImportanceCache;
+export const loadFeatureImportance = (): Promise<FeatureImportanceResponse> => {
+  if (!featureImportanceCache) {
+    featureImportanceCache = fetchDataFile<FeatureImportanceResponse>('feature_importance.json', 'feature importance').catch((error) => {
+      featureImportanceCache = null;
+      throw error;
+    });
   }
+  return featureImportanceCache;
+};
 
-  try {
-    const baseUrl = getBaseUrl();
-    const response = await fetch(`${baseUrl}data/feature_importance.json`);
-    if (!response.ok) {
-      throw new Error(`Failed to load feature importance: ${response.statusText}`);
+/**
+ * Build the customer ID -> prediction index once so lookups are O(1)
+ */
+const buildPredictionIndex = (predictions: UserPrediction[]): Map<string, UserPrediction> => {
+  const index = new Map<string, UserPrediction>();
+  for (const prediction of predictions) {
+    // First record wins, matching the previous linear search order
+    for (const id of [prediction.customerId, prediction.userId]) {
+      if (id && !index.has(id)) {
+        index.set(id, prediction);
+      }
     }
-    const data = await response.json();
-    featureImportanceCache = data;
-    return data;
-  } catch (error) {
-    console.error('Error loading feature importance:', error);
-    throw error;
   }
+  return index;
+};
+
+const loadPredictionIndex = (): Promise<Map<string, UserPrediction>> => {
+  if (!predictionIndexCache) {
+    predictionIndexCache = loadPredictions().then(buildPredictionIndex).catch((error) => {
+      predictionIndexCache = null;
+      throw error;
+    });
+  }
+  return predictionIndexCache;
 };
 
 /**
  * Get a single prediction by customer ID
  */
 export const getPredictionById = async (customerId: string): Promise<UserPrediction | null> => {
-  const predictions = await loadPredictions();
-  return predictions.find(p => p.customerId === customerId || p.userId === customerId) || null;
+  const index = await loadPredictionIndex();
+  return index.get(customerId) || null;
 };
 
 /**
@@ -162,14 +178,16 @@ export const getPredictionsByRisk = async (riskLevel: 'HIGH' | 'MEDIUM' | 'LOW')
 };
 
 /**
- * Get summary statistics
+ * Summarise risk levels with a single pass over the predictions
  */
-export const getPredictionStats = async () => {
-  const predictions = await loadPredictions();
+export const summarizePredictions = (predictions: UserPrediction[]) => {
+  const counts = { HIGH: 0, MEDIUM: 0, LOW: 0 };
+  for (const prediction of predictions) {
+    counts[prediction.riskLevel]++;
+  }
+
   const total = predictions.length;
-  const high = predictions.filter(p => p.riskLevel === 'HIGH').length;
-  const medium = predictions.filter(p => p.riskLevel === 'MEDIUM').length;
-  const low = predictions.filter(p => p.riskLevel === 'LOW').length;
+  const { HIGH: high, MEDIUM: medium, LOW: low } = counts;
 
   return {
     total,
@@ -182,6 +200,14 @@ export const getPredictionStats = async () => {
   };
 };
 
+/**
+ * Get summary statistics
+ */
+export const getPredictionStats = async () => {
+  const predictions = await loadPredictions();
+  return summarizePredictions(predictions);
+};
+
 /**
  * Clear cache (useful for testing)
  */
@@ -189,4 +215,5 @@ export const clearCache = () => {
   predictionsCache = null;
   metricsCache = null;
   featureImportanceCache = null;
+  predictionIndexCache = null;
 };
@@ -1,5 +1,23 @@
 import { UserPrediction } from "@/services/dataLoader";
 
+/**
+ * Trigger a browser download for a blob and release its object URL afterwards
+ */
+const downloadBlob = (blob: Blob, filename: string) => {
+  const link = document.createElement('a');
+  const url = URL.createObjectURL(blob);
+  
+  link.setAttribute('href', url);
+  link.setAttribute('download', filename);
+  link.style.visibility = 'hidden';
+  
+  document.body.appendChild(link);
+  link.click();
+  document.body.removeChild(link);
+  // Defer the revoke so the browser has picked up the download first
+  setTimeout(() => URL.revokeObjectURL(url), 0);
+};
+
 export const exportToCSV = (users: UserPrediction[], filename: string = 'churn-predictions.csv') => {
   // Define CSV headers
   const headers = [
@@ -19,42 +37,30 @@ export const exportToCSV = (users: UserPrediction[], filename: string = 'churn-p
     'Payment Method'
   ];
 
-  // Convert users to CSV rows
-  const rows = users.map(user => [
-    user.customerId || user.userId || 'N/A',
-    user.riskLevel,
-    (user.churnProbability * 100).toFixed(2),
-    user.tenureMonths || user.features.tenure_months || 'N/A',
-    user.lastActive,
-    user.contractType || 'N/A',
-    user.signupDate,
-    user.topDriver,
-    user.features.monthly_charges || 'N/A',
-    user.features.total_charges || 'N/A',
-    user.features.total_services || 'N/A',
-    user.features.billing_risk_score || 'N/A',
-    user.features.service_satisfaction_score || 'N/A',
-    user.features.payment_method || 'N/A'
-  ]);
+  // Build one string per CSV line and hand the parts straight to the Blob,
+  // instead of materialising a nested rows array and one giant joined string
+  const lines = [headers.join(',') + '\n'];
+  for (const user of users) {
+    const row = [
+      user.customerId || user.userId || 'N/A',
+      user.riskLevel,
+      (user.churnProbability * 100).toFixed(2),
+      user.tenureMonths || user.features.tenure_months || 'N/A',
+      user.lastActive,
+      user.contractType || 'N/A',
+      user.signupDate,
+      user.topDriver,
+      user.features.monthly_charges || 'N/A',
+      user.features.total_charges || 'N/A',
+      user.features.total_services || 'N/A',
+      user.features.billing_risk_score || 'N/A',
+      user.features.service_satisfaction_score || 'N/A',
+      user.features.payment_method || 'N/A'
+    ];
+    lines.push(`"${row.join('","')}"\n`);
+  }
 
-  // Combine headers and rows
-  const csvContent = [
-    headers.join(','),
-    ...rows.map(row => row.map(cell => `"${cell}"`).join(','))
-  ].join('\n');
-
-  // Create blob and download
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-  const link = document.createElement('a');
-  const url = URL.createObjectURL(blob);
-  
-  link.setAttribute('href', url);
-  link.setAttribute('download', filename);
-  link.style.visibility = 'hidden';
-  
-  document.body.appendChild(link);
-  link.click();
-  document.body.removeChild(link);
+  downloadBlob(new Blob(lines, { type: 'text/csv;charset=utf-8;' }), filename);
 };
 
 export const exportModelReport = () => {
@@ -106,15 +112,5 @@ RECOMMENDATIONS
 4. Cross-sell additional services to increase engagement
 `;
 
-  const blob = new Blob([reportContent], { type: 'text/plain;charset=utf-8;' });
-  const link = document.createElement('a');
-  const url = URL.createObjectURL(blob);
-  
-  link.setAttribute('href', url);
-  link.setAttribute('download', 'specsailor-churn-report.txt');
-  link.style.visibility = 'hidden';
-  
-  document.body.appendChild(link);
-  link.click();
-  document.body.removeChild(link);
+  downloadBlob(new Blob([reportContent], { type: 'text/plain;charset=utf-8;' }), 'specsailor-churn-report.txt');
 };